@@ -715,6 +715,10 @@ def traverse(traverse_static_array=True, traverse_tensor=True):
     Function decorator that traverses nested datastructures (e.g. dicts, lists,
     Dr.Jit struct, ...) and applies the decorated function to all JIT arrays
     it encounters.
+
+    Tuples whose entries all come back unchanged are returned as is. Lists,
+    mappings (as ``dict``) and custom data structures are always rebuilt, so
+    that the result never aliases a mutable input container.
     '''
     def wrapper(func: Callable):
         @_wraps(func)
@@ -745,7 +749,10 @@ def traverse(traverse_static_array=True, traverse_tensor=True):
                         res[i] = v
                 return res
             elif isinstance(a, Sequence) and not isinstance(a, str):
-                return ta(traverse(*slice_args(lambda x: x[i]), **kwargs) for i in range(len(a)))
+                values = [traverse(*slice_args(lambda x: x[i]), **kwargs) for i in range(len(a))]
+                if isinstance(a, tuple) and all(v is a[i] for i, v in enumerate(values)):
+                    return a
+                return ta(values)
             elif isinstance(a, Mapping):
                 return { k: traverse(*slice_args(lambda x: x[k]), **kwargs) for k in a.keys() }
             elif _dr.is_struct_v(a):
@@ -1,6 +1,7 @@
 from drjit import Dynamic, Exception, VarType
 import drjit as _dr
 import weakref as _wr
+import operator as _op
 
 
 def _check1(a0):
@@ -1172,55 +1173,58 @@ def any_(a0):
     return value
 
 
+def _reduce_tree(a0, op):
+    """Combine the entries of 'a0' using a pairwise tree of 'op' evaluations,
+       which keeps the dependency chain at log2(n) instead of n levels.
+       Arrays with up to 3 entries (where both orders coincide) use a plain
+       serial loop."""
+    size = len(a0)
+    if size <= 3:
+        value = a0[0]
+        for i in range(1, size):
+            value = op(value, a0[i])
+        return value
+
+    values = [a0[i] for i in range(size)]
+    while len(values) > 1:
+        reduced = [op(values[i], values[i + 1])
+                   for i in range(0, len(values) - 1, 2)]
+        if len(values) % 2 == 1:
+            reduced.append(values[-1])
+        values = reduced
+    return values[0]
+
+
 def sum_(a0):
     if a0.IsTensor:
         return a0.array.sum_()
-    size = len(a0)
-    if size == 0:
+    if len(a0) == 0:
         return 0
-    value = a0[0]
-    for i in range(1, size):
-        value = value + a0[i]
-    return value
+    return _reduce_tree(a0, _op.add)
 
 
 def prod_(a0):
     if a0.IsTensor:
         return a0.array.prod_()
-    size = len(a0)
-    if size == 0:
+    if len(a0) == 0:
         return 1
-    value = a0[0]
-    for i in range(1, size):
-        value = value * a0[i]
-    return value
+    return _reduce_tree(a0, _op.mul)
 
 
 def min_(a0):
     if a0.IsTensor:
         return a0.array.min_()
-    size = len(a0)
-    if size == 0:
+    if len(a0) == 0:
         raise Exception("min(): zero-sized array!")
-
-    value = a0[0]
-    for i in range(1, size):
-        value = _dr.minimum(value, a0[i])
-    return value
+    return _reduce_tree(a0, _dr.minimum)
 
 
 def max_(a0):
     if a0.IsTensor:
         return a0.array.max_()
-
-    size = len(a0)
-    if size == 0:
+    if len(a0) == 0:
         raise Exception("max(): zero-sized array!")
-
-    value = a0[0]
-    for i in range(1, size):
-        value = _dr.maximum(value, a0[i])
-    return value
+    return _reduce_tree(a0, _dr.maximum)
 
 
 def dot_(a0, a1):
@@ -5,7 +5,8 @@ from drjit.detail import array_name as _array_name
 from sys import modules as _modules
 import math as _math
 import builtins as _builtins
-from functools import wraps as _wraps
+from functools import wraps as _wraps, reduce as _reduce
+import operator as _operator
 from collections.abc import Mapping as _Mapping, \
                             Sequence as _Sequence
 
@@ -1907,7 +1908,8 @@ def maximum(a, b, /):
             a, b = _var_promote(a, b)
         return a.maximum_(b)
     else:
-        return _builtins.max(a, b)
+        # Equivalent to _builtins.max(a, b) without the call overhead
+        return b if b > a else a
 
 
 def minimum(a, b, /):
@@ -1931,7 +1933,8 @@ def minimum(a, b, /):
             a, b = _var_promote(a, b)
         return a.minimum_(b)
     else:
-        return _builtins.min(a, b)
+        # Equivalent to _builtins.min(a, b) without the call overhead
+        return b if b < a else a
 
 
 def fma(a, b, c, /):
@@ -3543,6 +3546,36 @@ def none_nested(arg, /):
     return not b if isinstance(b, bool) else ~b
 
 
+def _reduce_iterable(op, arg, default):
+    '''
+    Reduce the entries of a Python iterable using the binary operation ``op``.
+    The iteration runs within :py:func:`functools.reduce` instead of a Python
+    loop, though ``op`` itself is still called once per element. Returns
+    ``default`` when the iterable is empty.
+    '''
+    it = iter(arg)
+    empty = object()
+    first = next(it, empty)
+    if first is empty:
+        return default
+    return _reduce(op, it, first)
+
+
+def _reduce_nested(func, arg):
+    '''
+    Repeatedly apply the horizontal reduction ``func`` until ``arg`` is reduced
+    to a single value. Flat JIT arrays holding a single entry are returned
+    directly, as reducing them once more would only launch a redundant kernel.
+    '''
+    while True:
+        if isinstance(arg, (int, float)):
+            return arg
+        if _dr.is_jit_v(arg) and _dr.depth_v(arg) == 1 and \
+           not _dr.is_tensor_v(arg) and len(arg) == 1:
+            return arg
+        arg = func(arg)
+
+
 def sum(arg, /):
     '''
     sum(arg, /) -> float | int | drjit.ArrayBase
@@ -3563,13 +3596,7 @@ def sum(arg, /):
     elif isinstance(arg, float) or isinstance(arg, int):
         return arg
     elif _dr.is_iterable_v(arg):
-        result = 0
-        for index, value in enumerate(arg):
-            if index == 0:
-                result = value
-            else:
-                result = result + value
-        return result
+        return _reduce_iterable(_operator.add, arg, 0)
     else:
         raise Exception("sum(): input must be a boolean or an iterable "
                         "containing arithmetic types!")
@@ -3589,13 +3616,7 @@ def sum_nested(arg, /):
     Returns:
         Sum of the input
     '''
-    while True:
-        b = _dr.sum(arg)
-        ta, tb = type(arg), type(b)
-        if (tb is ta) and (ta in [int, float] or len(arg) == 1):
-            break
-        arg = b
-    return arg
+    return _reduce_nested(_dr.sum, arg)
 
 
 def mean(arg, /):
@@ -3660,13 +3681,7 @@ def prod(arg, /):
     elif isinstance(arg, float) or isinstance(arg, int):
         return arg
     elif _dr.is_iterable_v(arg):
-        result = 1
-        for index, value in enumerate(arg):
-            if index == 0:
-                result = value
-            else:
-                result = result * value
-        return result
+        return _reduce_iterable(_operator.mul, arg, 1)
     else:
         raise Exception("prod(): input must be a boolean or an iterable "
                         "containing arithmetic types!")
@@ -3683,13 +3698,7 @@ def prod_nested(arg, /):
     Returns:
         Product of the input
     '''
-    while True:
-        b = _dr.prod(arg)
-        ta, tb = type(arg), type(b)
-        if (tb is ta) and (ta in [int, float] or len(arg) == 1):
-            break
-        arg = b
-    return arg
+    return _reduce_nested(_dr.prod, arg)
 
 
 def max(arg, /):
@@ -3712,12 +3721,7 @@ def max(arg, /):
     elif isinstance(arg, float) or isinstance(arg, int):
         return arg
     elif _dr.is_iterable_v(arg):
-        result = None
-        for index, value in enumerate(arg):
-            if index == 0:
-                result = value
-            else:
-                result = _dr.maximum(result, value)
+        result = _reduce_iterable(_dr.maximum, arg, None)
         if result is None:
             raise Exception("max(): zero-sized array!")
         return result
@@ -3737,13 +3741,7 @@ def max_nested(arg, /):
     Returns:
         Maximum scalar value of the input
     '''
-    while True:
-        b = _dr.max(arg)
-        ta, tb = type(arg), type(b)
-        if (tb is ta) and (ta in [int, float] or len(arg) == 1):
-            break
-        arg = b
-    return arg
+    return _reduce_nested(_dr.max, arg)
 
 
 def min(arg, /):
@@ -3766,12 +3764,7 @@ def min(arg, /):
     elif isinstance(arg, float) or isinstance(arg, int):
         return arg
     elif _dr.is_iterable_v(arg):
-        result = None
-        for index, value in enumerate(arg):
-            if index == 0:
-                result = value
-            else:
-                result = _dr.minimum(result, value)
+        result = _reduce_iterable(_dr.minimum, arg, None)
         if result is None:
             raise Exception("min(): zero-sized array!")
         return result
@@ -3791,13 +3784,7 @@ def min_nested(arg, /):
     Returns:
         Minimum scalar value of the input
     '''
-    while True:
-        b = _dr.min(arg)
-        ta, tb = type(arg), type(b)
-        if (tb is ta) and (ta in [int, float] or len(arg) == 1):
-            break
-        arg = b
-    return arg
+    return _reduce_nested(_dr.min, arg)
 
 
 def dot(a, b, /):
@@ -4103,6 +4090,9 @@ def detach(arg, preserve_type=True):
     underlying variables.
 
     When the input variable isn't a Dr.Jit differentiable array, it is returned as it is.
+    Differentiable arrays, custom data structures, lists and mappings are always
+    returned as new objects (sharing the underlying JIT variables), so that
+    in-place modifications of the result don't affect the input.
 
     While the type of the returned array is preserved by default, it is possible to
     set the ``preserve_type`` argument to false to force the returned type to be
@@ -4131,8 +4121,12 @@ def detach(arg, preserve_type=True):
             setattr(result, k, detach(getattr(arg, k),
                 preserve_type=preserve_type))
         return result
-    elif isinstance(arg, _Sequence):
-        return type(arg)(detach(a, preserve_type) for a in arg)
+    elif isinstance(arg, _Sequence) and not isinstance(arg, str):
+        values = [detach(a, preserve_type) for a in arg]
+        # Immutable tuples without differentiable entries are returned as is
+        if isinstance(arg, tuple) and all(v is a for v, a in zip(values, arg)):
+            return arg
+        return type(arg)(values)
     elif isinstance(arg, dict):
         return { k: detach(v, preserve_type) for k, v in arg.items() }
     else:
@@ -4289,20 +4283,21 @@ def grad_enabled(*args):
     Returns:
         bool: ``True`` if any variable has gradient tracking enabled, ``False`` otherwise.
     '''
-    result = False
+    # Stop the traversal as soon as a gradient-enabled variable is found
     for a in args:
         if _dr.is_diff_v(a):
-            result |= a.grad_enabled_()
+            if a.grad_enabled_():
+                return True
         elif _dr.is_struct_v(a):
-            for k in type(a).DRJIT_STRUCT.keys():
-                result |= grad_enabled(getattr(a, k))
+            if grad_enabled(*(getattr(a, k) for k in type(a).DRJIT_STRUCT.keys())):
+                return True
         elif isinstance(a, _Sequence) and not isinstance(a, str):
-            for v in a:
-                result |= grad_enabled(v)
+            if grad_enabled(*a):
+                return True
         elif isinstance(a, _Mapping):
-            for k, v in a.items():
-                result |= grad_enabled(v)
-    return result
+            if grad_enabled(*a.values()):
+                return True
+    return False
 
 
 def set_grad_enabled(arg, value):
@@ -5927,142 +5922,144 @@ def wrap_ad(source: str, target: str):
                         'expected one to be drjit!', source, target)
 
     def wrapper(func: Callable):
+        if 'torch' in [source, target]:
+            import torch as _torch
+
+        # Return whether the input argument is a PyTorch tensor
+        def is_torch_tensor(a):
+            return getattr(a, '__module__', None) == 'torch' \
+                   and type(a).__name__ == 'Tensor'
+
+        # Casting routing from Dr.Jit tensors to PyTorch tensors
+        def drjit_to_torch(a, enable_grad = False):
+            if isinstance(a, _Sequence) and not isinstance(a, str):
+                return tuple(drjit_to_torch(b, enable_grad) for b in a)
+            elif isinstance(a, _Mapping):
+                return {k: drjit_to_torch(v, enable_grad) for k, v in a.items()}
+            elif _dr.is_array_v(a) and _dr.is_tensor_v(a):
+                b = a.torch()
+                b.requires_grad = _dr.grad_enabled(a) or (enable_grad and _dr.is_diff_v(a))
+                return b
+            elif _dr.is_diff_v(a) and a.IsFloat:
+                raise TypeError("wrap_ad(): differential input arguments "
+                                "should be Dr.Jit tensor!")
+            else:
+                return a
+
+        # Casting routing from PyTorch tensors to Dr.Jit tensors
+        def torch_to_drjit(a):
+            if isinstance(a, _Sequence) and not isinstance(a, str):
+                return tuple(torch_to_drjit(b) for b in a)
+            elif isinstance(a, _Mapping):
+                return {k: torch_to_drjit(v) for k, v in a.items()}
+            elif is_torch_tensor(a):
+                dtype_str = {
+                    _torch.float:   'TensorXf',
+                    _torch.float32: 'TensorXf',
+                    _torch.float64: 'TensorXf64',
+                    _torch.int32:   'TensorXi',
+                    _torch.int:     'TensorXi',
+                    _torch.int64:   'TensorXi64',
+                    _torch.long:    'TensorXi64',
+                }[a.dtype]
+                device = 'cuda' if a.is_cuda else 'llvm'
+                m = getattr(getattr(_dr, device),'ad')
+                return getattr(m, dtype_str)(a)
+            else:
+                return a
+
+        # Ensure gradient tensors in `a` have same shape as tensors in `b` (handles dim==0 case)
+        def torch_ensure_grad_shape(a, b):
+            if isinstance(a, _Sequence) and not isinstance(a, str):
+                return tuple(torch_ensure_grad_shape(a[i], b[i]) for i in range(len(a)))
+            elif isinstance(a, _Mapping):
+                return {k: torch_ensure_grad_shape(v, b[k]) for k, v in a.items()}
+            elif is_torch_tensor(a) and a.dtype in [_torch.float, _torch.float32, _torch.float64]:
+                return a.reshape(b.shape)
+            else:
+                return a
+
+        if source == 'torch':
+            class ToDrJit(_torch.autograd.Function):
+                @staticmethod
+                def forward(ctx, *args):
+                    ctx.args = args
+                    ctx.args_drjit = torch_to_drjit(args)
+                    _dr.enable_grad(ctx.args_drjit)
+                    res = func(*ctx.args_drjit)
+                    ctx.res_drjit = (res,) if not isinstance(res, tuple) else res
+                    return drjit_to_torch(res)
+
+                @staticmethod
+                @_torch.autograd.function.once_differentiable
+                def backward(ctx, *grad_output):
+                    _dr.set_grad(ctx.res_drjit, grad_output)
+                    _dr.enqueue(_dr.ADMode.Backward, ctx.res_drjit)
+                    _dr.traverse(ctx.res_drjit, _dr.ADMode.Backward)
+                    args_grad = drjit_to_torch(_dr.grad(ctx.args_drjit))
+                    args_grad = torch_ensure_grad_shape(args_grad, ctx.args)
+                    del ctx.res_drjit, ctx.args_drjit
+                    return args_grad
+
+        if target == 'torch':
+            class ToTorch(_dr.CustomOp):
+                def eval(self, *args):
+                    self.args = args
+                    self.args_torch = drjit_to_torch(args, enable_grad=True)
+                    self.res_torch = func(*self.args_torch)
+                    return torch_to_drjit(self.res_torch)
+
+                def forward(self):
+                    raise TypeError("warp_ad(): forward-mode AD is not supported!")
+
+                def backward(self):
+                    grad_out_torch = drjit_to_torch(self.grad_out())
+                    grad_out_torch = torch_ensure_grad_shape(grad_out_torch, self.res_torch)
+                    def flatten(values):
+                        """Flatten structure in a consistent arbitrary order"""
+                        result = []
+                        def traverse(values):
+                            if isinstance(values, _Sequence):
+                                for v in values:
+                                    traverse(v)
+                            elif isinstance(values, _Mapping):
+                                for _, v in sorted(values.items(), key=lambda item: item[0]):
+                                    traverse(v)
+                            else:
+                                result.append(values)
+                        traverse(values)
+
+                        # Single item should not be wrapped into a list
+                        if not isinstance(values, _Sequence) and not isinstance(values, _Mapping):
+                            result = result[0]
+
+                        return result
+
+                    _torch.autograd.backward(flatten(self.res_torch), flatten(grad_out_torch))
+
+                    def get_grads(args):
+                        if isinstance(args, _Sequence) and not isinstance(args, str):
+                            return tuple(get_grads(b) for b in args)
+                        elif isinstance(args, _Mapping):
+                            return {k: get_grads(v) for k, v in args.items()}
+                        elif is_torch_tensor(args):
+                            return getattr(args, 'grad', None)
+                        else:
+                            return None
+
+                    args_grad_torch = get_grads(self.args_torch)
+                    args_grad = torch_to_drjit(args_grad_torch)
+                    self.set_grad_in('args', args_grad)
+
         @_wraps(func)
         def f(*args, **kwargs):
-            if 'torch' in [source, target]:
-                import torch as _torch
-
-            # Return whether the input argument is a PyTorch tensor
-            def is_torch_tensor(a):
-                return getattr(a, '__module__', None) == 'torch' \
-                       and type(a).__name__ == 'Tensor'
-
-            # Casting routing from Dr.Jit tensors to PyTorch tensors
-            def drjit_to_torch(a, enable_grad = False):
-                if isinstance(a, _Sequence) and not isinstance(a, str):
-                    return tuple(drjit_to_torch(b, enable_grad) for b in a)
-                elif isinstance(a, _Mapping):
-                    return {k: drjit_to_torch(v, enable_grad) for k, v in a.items()}
-                elif _dr.is_array_v(a) and _dr.is_tensor_v(a):
-                    b = a.torch()
-                    b.requires_grad = _dr.grad_enabled(a) or (enable_grad and _dr.is_diff_v(a))
-                    return b
-                elif _dr.is_diff_v(a) and a.IsFloat:
-                    raise TypeError("wrap_ad(): differential input arguments "
-                                    "should be Dr.Jit tensor!")
-                else:
-                    return a
-
-            # Casting routing from PyTorch tensors to Dr.Jit tensors
-            def torch_to_drjit(a):
-                if isinstance(a, _Sequence) and not isinstance(a, str):
-                    return tuple(torch_to_drjit(b) for b in a)
-                elif isinstance(a, _Mapping):
-                    return {k: torch_to_drjit(v) for k, v in a.items()}
-                elif is_torch_tensor(a):
-                    dtype_str = {
-                        _torch.float:   'TensorXf',
-                        _torch.float32: 'TensorXf',
-                        _torch.float64: 'TensorXf64',
-                        _torch.int32:   'TensorXi',
-                        _torch.int:     'TensorXi',
-                        _torch.int64:   'TensorXi64',
-                        _torch.long:    'TensorXi64',
-                    }[a.dtype]
-                    device = 'cuda' if a.is_cuda else 'llvm'
-                    m = getattr(getattr(_dr, device),'ad')
-                    return getattr(m, dtype_str)(a)
-                else:
-                    return a
-
-            # Ensure gradient tensors in `a` have same shape as tensors in `b` (handles dim==0 case)
-            def torch_ensure_grad_shape(a, b):
-                if isinstance(a, _Sequence) and not isinstance(a, str):
-                    return tuple(torch_ensure_grad_shape(a[i], b[i]) for i in range(len(a)))
-                elif isinstance(a, _Mapping):
-                    return {k: torch_ensure_grad_shape(v, b[k]) for k, v in a.items()}
-                elif is_torch_tensor(a) and a.dtype in [_torch.float, _torch.float32, _torch.float64]:
-                    return a.reshape(b.shape)
-                else:
-                    return a
-
             # Construct the full tuple of positional arguments
             args = _dr.detail.get_args_values(func, *args, **kwargs)
 
             if source == 'torch':
-                class ToDrJit(_torch.autograd.Function):
-                    @staticmethod
-                    def forward(ctx, *args):
-                        ctx.args = args
-                        ctx.args_drjit = torch_to_drjit(args)
-                        _dr.enable_grad(ctx.args_drjit)
-                        res = func(*ctx.args_drjit)
-                        ctx.res_drjit = (res,) if not isinstance(res, tuple) else res
-                        return drjit_to_torch(res)
-
-                    @staticmethod
-                    @_torch.autograd.function.once_differentiable
-                    def backward(ctx, *grad_output):
-                        _dr.set_grad(ctx.res_drjit, grad_output)
-                        _dr.enqueue(_dr.ADMode.Backward, ctx.res_drjit)
-                        _dr.traverse(ctx.res_drjit, _dr.ADMode.Backward)
-                        args_grad = drjit_to_torch(_dr.grad(ctx.args_drjit))
-                        args_grad = torch_ensure_grad_shape(args_grad, ctx.args)
-                        del ctx.res_drjit, ctx.args_drjit
-                        return args_grad
-
                 return ToDrJit.apply(*args)
 
             if target == 'torch':
-                class ToTorch(_dr.CustomOp):
-                    def eval(self, *args):
-                        self.args = args
-                        self.args_torch = drjit_to_torch(args, enable_grad=True)
-                        self.res_torch = func(*self.args_torch)
-                        return torch_to_drjit(self.res_torch)
-
-                    def forward(self):
-                        raise TypeError("warp_ad(): forward-mode AD is not supported!")
-
-                    def backward(self):
-                        grad_out_torch = drjit_to_torch(self.grad_out())
-                        grad_out_torch = torch_ensure_grad_shape(grad_out_torch, self.res_torch)
-                        def flatten(values):
-                            """Flatten structure in a consistent arbitrary order"""
-                            result = []
-                            def traverse(values):
-                                if isinstance(values, _Sequence):
-                                    for v in values:
-                                        traverse(v)
-                                elif isinstance(values, _Mapping):
-                                    for _, v in sorted(values.items(), key=lambda item: item[0]):
-                                        traverse(v)
-                                else:
-                                    result.append(values)
-                            traverse(values)
-
-                            # Single item should not be wrapped into a list
-                            if not isinstance(values, _Sequence) and not isinstance(values, _Mapping):
-                                result = result[0]
-
-                            return result
-
-                        _torch.autograd.backward(flatten(self.res_torch), flatten(grad_out_torch))
-
-                        def get_grads(args):
-                            if isinstance(args, _Sequence) and not isinstance(args, str):
-                                return tuple(get_grads(b) for b in args)
-                            elif isinstance(args, _Mapping):
-                                return {k: get_grads(v) for k, v in args.items()}
-                            elif is_torch_tensor(args):
-                                return getattr(args, 'grad', None)
-                            else:
-                                return None
-
-                        args_grad_torch = get_grads(self.args_torch)
-                        args_grad = torch_to_drjit(args_grad_torch)
-                        self.set_grad_in('args', args_grad)
-
                 return _dr.custom(ToTorch, args)
 
         return f
@@ -6147,6 +6144,37 @@ def switch(indices, funcs, *args):
 
     Type = _dr.float32_array_t(indices)
     Mask = _dr.mask_t(indices)
+
+    # A literal index selects the same function for all entries. For a single
+    # lane, a recorded vectorized call evaluates that function exactly once
+    # (including side effects), so call it directly instead of tracing every
+    # function. Wider calls are left to the vectorized call, which runs side
+    # effects once per lane.
+    if _dr.is_jit_v(indices) and indices.is_literal_() and \
+       _dr.flag(_dr.JitFlag.VCallRecord) and \
+       not (len(args) > 0 and isinstance(args[-1], Mask)):
+        index = indices[0]
+        size = _dr.width(indices)
+
+        @_dr.detail.traverse()
+        def arg_width(arg):
+            nonlocal size
+            size = _builtins.max(size, _dr.width(arg))
+            return arg
+
+        arg_width(args)
+
+        if size == 1 and index < len(funcs) and funcs[index] is not None:
+            # Like the vectorized call, return fresh single-lane variables
+            @_dr.detail.traverse()
+            def ad_copy(arg):
+                if _dr.width(arg) != 1:
+                    raise Exception("switch(): function outputs must match "
+                                    "the width of the inputs!")
+                return arg.copy_() if _dr.is_diff_v(arg) else type(arg)(arg)
+
+            return ad_copy(funcs[index](*args))
+
     mod = _modules.get(Type.__module__)
 
     # Dr.Jit expects callable indices to start at 1
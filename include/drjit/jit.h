@@ -330,10 +330,15 @@ struct JitArray : ArrayBase<Value_, is_mask_v<Value_>, Derived_> {
         return jit_var_any(m_index);
     }
 
+    /* Arrays with a single entry are already reduced, don't launch a kernel
+       in that case. Larger inputs are dispatched to jit_var_reduce(). */
     #define DRJIT_HORIZONTAL_OP(name, op, default_op)                          \
         Derived name##_() const {                                              \
-            if (size() == 0)                                                   \
+            size_t n = size();                                                 \
+            if (n == 0)                                                        \
                 default_op;                                                    \
+            else if (n == 1)                                                   \
+                return derived();                                              \
             return steal(jit_var_reduce(m_index, op));                         \
         }
 
@@ -897,13 +897,25 @@ template <typename Value_, bool IsMask_, typename Derived_> struct alignas(32)
     //! @{ \name Horizontal operations (adapted for the n=3 case)
     // -----------------------------------------------------------------------
 
-    DRJIT_INLINE Value sum_() const {
-        Value result = entry(0);
-        for (size_t i = 1; i < 3; ++i)
-            result += entry(i);
-        return result;
-    }
+    #define DRJIT_HORIZONTAL_OP(name, op_s, op_u)                             \
+        DRJIT_INLINE Value name##_() const {                                  \
+            __m128i t1 = _mm256_extracti128_si256(m, 1);                      \
+            __m128i t2 = _mm256_castsi256_si128(m);                           \
+            t1 = std::is_signed_v<Value> ? _mm_##op_s(t1, t2)                 \
+                                         : _mm_##op_u(t1, t2);                \
+            t2 = _mm_unpackhi_epi64(t2, t2);                                  \
+            t2 = std::is_signed_v<Value> ? _mm_##op_s(t2, t1)                 \
+                                         : _mm_##op_u(t2, t1);                \
+            return (Value) detail::mm_cvtsi128_si64(t2);                      \
+        }
 
+    DRJIT_HORIZONTAL_OP(sum, add_epi64, add_epi64)
+
+#if defined(DRJIT_X86_AVX512)
+    DRJIT_HORIZONTAL_OP(prod, mullo_epi64, mullo_epi64)
+    DRJIT_HORIZONTAL_OP(min, min_epi64, min_epu64)
+    DRJIT_HORIZONTAL_OP(max, max_epi64, max_epu64)
+#else
     DRJIT_INLINE Value prod_() const {
         Value result = entry(0);
         for (size_t i = 1; i < 3; ++i)
@@ -924,6 +936,9 @@ template <typename Value_, bool IsMask_, typename Derived_> struct alignas(32)
             result = drjit::maximum(result, entry(i));
         return result;
     }
+#endif
+
+    #undef DRJIT_HORIZONTAL_OP
 
     DRJIT_INLINE bool all_()  const { return (_mm256_movemask_pd(_mm256_castsi256_pd(m)) & 7) == 7;}
     DRJIT_INLINE bool any_()  const { return (_mm256_movemask_pd(_mm256_castsi256_pd(m)) & 7) != 0; }
@@ -1605,6 +1605,19 @@ void ad_set_grad(uint32_t index, const T &value, bool fail_if_missing) {
                  size_in, index, v.size);
 
     ad_trace("ad_set_grad(a%u)", index);
+
+    if constexpr (is_jit_v<T>) {
+        /* Setting a zero-valued literal (e.g. when clearing gradients before
+           accumulating new ones) releases the gradient instead. Reads still
+           produce zeros, and the next ad_accum_grad() simply assigns its
+           value instead of generating an addition involving a literal. */
+        if (jit_flag(JitFlag::ADOptimize) && value.is_literal() &&
+            value[0] == 0) {
+            v.grad = T();
+            return;
+        }
+    }
+
     if (v.size != 1 || size_in == 1)
         v.grad = value;
     else
@@ -40,6 +40,9 @@ py::object switch_record_impl(UInt32 indices, py::list funcs, py::args args) {
     dr_vector<uint32_t> state(n_inst + 1, 0);
     dr_vector<uint32_t> inst_id(n_inst, 0);
 
+    // Variable types of the outputs of the first traced function
+    dr_vector<uint32_t> signature;
+
     // Wrap arguments with placeholders
     args = apply_cpp(args, py::cpp_function([&](uint32_t index) {
         uint32_t new_index = jit_var_wrap_vcall(index);
@@ -83,11 +86,23 @@ py::object switch_record_impl(UInt32 indices, py::list funcs, py::args args) {
             throw py::type_error("switch(): inconsistent return types!");
         result = result2;
 
-        // Collect output indices
+        // Collect output indices and check that their number and types match
+        // those of the first function (the Python types only cover the root)
+        size_t n_out = 0;
+        bool consistent = true;
         apply_cpp(result, py::cpp_function([&](uint32_t index){
+            uint32_t type = (uint32_t) jit_var_type(index);
+            if (j == 1)
+                signature.push_back(type);
+            else if (n_out >= signature.size() || signature[n_out] != type)
+                consistent = false;
+            n_out++;
             indices_out_all.push_back(index);
         }));
 
+        if (!consistent || n_out != signature.size())
+            throw py::type_error("switch(): inconsistent return types!");
+
         jit_state.clear_mask();
 
         state[j] = jit_record_checkpoint(Backend);
@@ -215,6 +215,12 @@ def test05_accum_grad(m):
     dr.accum_grad(a, [3.0, 2.0, 1.0])
     assert dr.allclose(dr.grad(a), [8.0, 7.0, 6.0])
 
+    # Clear, then accumulate
+    dr.set_grad(a, 0.0)
+    assert dr.allclose(dr.grad(a), [0.0, 0.0, 0.0])
+    dr.accum_grad(a, 2.0)
+    assert dr.allclose(dr.grad(a), [2.0, 2.0, 2.0])
+
     a = m.Array3f([1, 2, 3], [2, 3, 4], [3, 4, 5])
     dr.enable_grad(a)
     assert dr.allclose(dr.grad(a), 0.0)
@@ -1942,3 +1948,57 @@ def test80_backward_from_complex(m):
     b = 2 * a
     dr.backward_from(b)
     assert dr.allclose(dr.grad(a), m.Complex2f(0, 2))
+
+
+def test81_traverse_unchanged(m):
+    @dr.detail.traverse()
+    def ad_copy(arg):
+        return arg.copy_() if dr.grad_enabled(arg) else arg
+
+    a, b = m.Float(1.0), m.Float(2.0)
+    dr.enable_grad(a)
+
+    # Unchanged tuples are returned as is
+    t = (b, (b,))
+    assert ad_copy(t) is t
+
+    u = (a, (b,))
+    r = ad_copy(u)
+    assert r is not u and r[0] is not a
+    assert r[1] is u[1]
+
+    # Mutable containers are always rebuilt
+    s = struct_class(m)()
+    l = [b, {'k': b}, s]
+    r = ad_copy(l)
+    assert r is not l and r[1] is not l[1] and r[2] is not s
+    assert r[0] is b and r[1]['k'] is b and r[2].x is s.x
+
+
+def test83_detach_no_alias(m):
+    a, b = m.Float(1.0), m.Float([1, 2, 3])
+    dr.enable_grad(a)
+
+    # In-place updates of the result must not affect the input
+    c = dr.detach(b)
+    assert c is not b
+    c += 1
+    assert dr.allclose(b, [1, 2, 3])
+
+    l = [b, {'k': b}]
+    r = dr.detach(l)
+    assert r is not l and r[1] is not l[1]
+    r.append(a)
+    assert len(l) == 2
+
+    s = struct_class(m)()
+    r = dr.detach(s)
+    assert r is not s and r.x is not s.x
+
+    # Tuples that don't contain differentiable variables are returned as is
+    t = (1.0, 'k', (2, 3))
+    assert dr.detach(t) is t
+
+    u = (a, b)
+    r = dr.detach(u)
+    assert r is not u and not dr.grad_enabled(r)
@@ -1,15 +1,22 @@
 import drjit as dr
 import pytest
+import functools
 import gc
 
 
+@functools.lru_cache(maxsize=None)
+def has_backend(backend):
+    """Cached version of ``dr.has_backend()``, which may probe devices"""
+    return dr.has_backend(backend)
+
+
 def get_class(name):
     """Resolve a package+class name into the corresponding type"""
     if 'cuda' in name:
-        if not dr.has_backend(dr.JitBackend.CUDA):
+        if not has_backend(dr.JitBackend.CUDA):
             pytest.skip('CUDA mode is unsupported')
     elif 'llvm' in name:
-        if not dr.has_backend(dr.JitBackend.LLVM):
+        if not has_backend(dr.JitBackend.LLVM):
             pytest.skip('LLVM mode is unsupported')
     elif 'packet' in name and not hasattr(dr, 'packet'):
         pytest.skip('Packet mode is unsupported')
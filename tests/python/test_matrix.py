@@ -1,5 +1,6 @@
 import drjit as dr
 import pytest
+import functools
 import importlib
 
 from drjit.scalar import Matrix2f as M2
@@ -8,12 +9,19 @@ from drjit.scalar import Matrix4f as M4
 from drjit.scalar import Float
 M = M4
 
+
+@functools.lru_cache(maxsize=None)
+def has_backend(backend):
+    """Cached version of ``dr.has_backend()``, which may probe devices"""
+    return dr.has_backend(backend)
+
+
 def prepare(pkg):
     if 'cuda' in pkg:
-        if not dr.has_backend(dr.JitBackend.CUDA):
+        if not has_backend(dr.JitBackend.CUDA):
             pytest.skip('CUDA mode is unsupported')
     elif 'llvm' in pkg:
-        if not dr.has_backend(dr.JitBackend.LLVM):
+        if not has_backend(dr.JitBackend.LLVM):
             pytest.skip('LLVM mode is unsupported')
     return importlib.import_module(pkg)
 
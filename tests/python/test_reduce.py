@@ -248,3 +248,28 @@ def test09_scatter_inc(m):
     out_np = np.array(out)
     out_np.sort()
     assert np.all(out_np == np.arange(n))
+
+
+def test10_nested_no_redundant_reduction(m, monkeypatch):
+    # *_nested() must stop once the value is fully reduced, without
+    # reducing the single-entry result once more
+    for name in ['sum', 'prod', 'min', 'max']:
+        calls = []
+        func = getattr(dr, name)
+
+        def counted(arg, func=func, calls=calls):
+            calls.append(arg)
+            return func(arg)
+
+        monkeypatch.setattr(dr, name, counted)
+        nested = getattr(dr, name + '_nested')
+
+        a = nested(m.Float([1, 2, 3]))
+        assert type(a) is m.Float and len(calls) == 1
+
+        calls.clear()
+        a = nested(m.Array3f([1, 2], [3, 4], [5, 6]))
+        assert type(a) is m.Float and len(calls) == 2
+
+        calls.clear()
+        assert nested(6.0) == 6.0 and len(calls) == 0
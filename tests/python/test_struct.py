@@ -1,14 +1,21 @@
 import drjit as dr
 import pytest
+import functools
 import importlib
 
 
+@functools.lru_cache(maxsize=None)
+def has_backend(backend):
+    """Cached version of ``dr.has_backend()``, which may probe devices"""
+    return dr.has_backend(backend)
+
+
 def prepare(pkg):
     if 'cuda' in pkg:
-        if not dr.has_backend(dr.JitBackend.CUDA):
+        if not has_backend(dr.JitBackend.CUDA):
             pytest.skip('CUDA mode is unsupported')
     elif 'llvm' in pkg:
-        if not dr.has_backend(dr.JitBackend.LLVM):
+        if not has_backend(dr.JitBackend.LLVM):
             pytest.skip('LLVM mode is unsupported')
     return importlib.import_module(pkg)
 
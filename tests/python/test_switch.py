@@ -1,14 +1,21 @@
 import drjit as dr
 import pytest
+import functools
+
+
+@functools.lru_cache(maxsize=None)
+def has_backend(backend):
+    """Cached version of ``dr.has_backend()``, which may probe devices"""
+    return dr.has_backend(backend)
 
 
 def get_module(name):
     """Resolve a package+class name into the corresponding type"""
     if 'cuda' in name:
-        if not dr.has_backend(dr.JitBackend.CUDA):
+        if not has_backend(dr.JitBackend.CUDA):
             pytest.skip('CUDA mode is unsupported')
     elif 'llvm' in name:
-        if not dr.has_backend(dr.JitBackend.LLVM):
+        if not has_backend(dr.JitBackend.LLVM):
             pytest.skip('LLVM mode is unsupported')
     elif 'packet' in name and not hasattr(dr, 'packet'):
         pytest.skip('Packet mode is unsupported')
@@ -235,3 +242,88 @@ def test06_switch_failure(modname, recorded):
     with pytest.raises(RuntimeError) as ei:
         dr.forward(a)
     assert "bar" in str(ei.value)
+
+
+@pytest.mark.parametrize("modname", ["drjit.cuda.ad", "drjit.llvm.ad"])
+@pytest.mark.parametrize("recorded", [True, False])
+def test07_switch_uniform(modname, recorded):
+    m = get_module(modname)
+
+    dr.set_flag(dr.JitFlag.VCallRecord, recorded)
+
+    def f(a):
+        return a * 4.0
+
+    def g(a):
+        raise RuntimeError("g() should not be traced")
+
+    # A single lane with a literal index only evaluates the selected function
+    a = m.Float(2.0)
+    dr.enable_grad(a)
+
+    result = dr.switch(m.UInt(0), [f, g], a)
+    assert dr.allclose(result, 8)
+
+    dr.backward(result)
+    assert dr.allclose(dr.grad(a), 4)
+
+    # Outputs are never the input variables themselves
+    result = dr.switch(m.UInt(0), [lambda x: x], a)
+    assert result is not a and dr.allclose(result, a)
+
+    # Wider inputs take the vectorized call
+    b = m.Float([1.0, 2.0, 3.0, 4.0])
+    result = dr.switch(dr.zeros(m.UInt, 4), [lambda x: x + 1, None], b)
+    assert dr.width(result) == 4 and dr.allclose(result, [2, 3, 4, 5])
+
+    result = dr.switch(dr.zeros(m.UInt, 4), [lambda x: x + 1], a)
+    assert dr.width(result) == 4 and dr.allclose(result, 3)
+
+    if not recorded:
+        return
+
+    # Side effects run once per lane, whether or not the index is a literal
+    for n in [1, 4]:
+        counts = []
+        for idx in [dr.zeros(m.UInt, n), m.UInt([0] * n)]:
+            buf = dr.zeros(m.Float, 2)
+
+            def h(x):
+                dr.scatter_reduce(dr.ReduceOp.Add, buf, m.Float(1), m.UInt(0))
+                return x
+
+            result = dr.switch(idx, [h], dr.full(m.Float, 1, n))
+            dr.eval(result, buf)
+            counts.append(buf[0])
+        assert counts == [n, n]
+
+    with pytest.raises(Exception) as ei:
+        dr.switch(m.UInt(0), [lambda x: dr.arange(m.Float, 10)], a)
+    assert "width of the inputs" in str(ei.value)
+
+
+@pytest.mark.parametrize("modname", ["drjit.cuda.ad", "drjit.llvm.ad"])
+def test08_switch_inconsistent_outputs(modname):
+    m = get_module(modname)
+
+    dr.set_flag(dr.JitFlag.VCallRecord, True)
+
+    def f(a):
+        return (a, a * 2.0)
+
+    def g(a):
+        return (a,)
+
+    def h(a):
+        return (a, m.Int(a))
+
+    a = m.Float([1.0, 2.0, 3.0, 4.0])
+    idx = m.UInt([0, 1, 0, 1])
+
+    with pytest.raises(TypeError) as ei:
+        dr.switch(idx, [f, g], a)
+    assert "inconsistent return types" in str(ei.value)
+
+    with pytest.raises(TypeError) as ei:
+        dr.switch(idx, [f, h], a)
+    assert "inconsistent return types" in str(ei.value)
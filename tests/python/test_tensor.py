@@ -1,5 +1,6 @@
 import drjit as dr
 import pytest
+import functools
 
 #  pkgs = ["drjit.cuda", "drjit.cuda.ad",
 #          "drjit.llvm", "drjit.llvm.ad"]
@@ -7,13 +8,20 @@ import pytest
 pkgs = ["drjit.llvm", "drjit.llvm.ad"]
 pkgs_ad = ["drjit.llvm.ad"]
 
+
+@functools.lru_cache(maxsize=None)
+def has_backend(backend):
+    """Cached version of ``dr.has_backend()``, which may probe devices"""
+    return dr.has_backend(backend)
+
+
 def get_class(name):
     """Resolve a package+class name into the corresponding type"""
     if 'cuda' in name:
-        if not dr.has_backend(dr.JitBackend.CUDA):
+        if not has_backend(dr.JitBackend.CUDA):
             pytest.skip('CUDA mode is unsupported')
     elif 'llvm' in name:
-        if not dr.has_backend(dr.JitBackend.LLVM):
+        if not has_backend(dr.JitBackend.LLVM):
             pytest.skip('LLVM mode is unsupported')
 
     name = name.split('.')